@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import colorsys
+import functools
 import math
 from typing import *  # type: ignore
 
@@ -369,7 +370,7 @@ class Color(SelfSerializing):
         """
         return (self._red, self._green, self._blue)
 
-    @property
+    @functools.cached_property
     def rgba(self) -> tuple[float, float, float, float]:
         """
         The color as RGBA values.
@@ -379,7 +380,9 @@ class Color(SelfSerializing):
         """
         return (self._red, self._green, self._blue, self._opacity)
 
-    @property
+    # Colors are immutable, so derived values like these can be computed once
+    # and cached. Theme building and serialization read them repeatedly.
+    @functools.cached_property
     def hsv(self) -> tuple[float, float, float]:
         """
         The color as HSV values.
@@ -418,7 +421,7 @@ class Color(SelfSerializing):
         """
         return self.hsv[2]
 
-    @property
+    @functools.cached_property
     def perceived_brightness(self) -> float:
         """
         How bright the color appears to humans.
@@ -1,3 +1,7 @@
+# perf-note: There is no numeric work in this module to JIT-compile. The hot
+# path is serialization, so improvements belong in allocation reuse (see the
+# serialize cache below), not in compilers like numba.
+
 from __future__ import annotations
 
 from typing import *  # type: ignore
@@ -5,6 +9,7 @@ from typing import *  # type: ignore
 import rio
 
 from .. import utils
+from ..dataclass import internal_field
 from .component import Component
 
 __all__ = [
@@ -20,6 +25,13 @@ class DialogContainer(Component):
     user_closeable: bool
     on_close: rio.EventHandler[[]]
 
+    # The serialized form of this component, as of the last `serialize` call.
+    # The fields above rarely change, so the result is cached and reused as
+    # long as they keep their values.
+    _serialize_cache: tuple[tuple[int, bool, bool], dict[str, Any]] | None = (
+        internal_field(init=False, default=None)
+    )
+
     def build(self) -> Component:
         return utils.safe_build(self.build_content)
 
@@ -28,8 +40,18 @@ class DialogContainer(Component):
     # fundamental. To prevent a whole bunch of custom code in the serializer,
     # this function handles the serialization of dialog containers.
     def serialize(self) -> dict[str, Any]:
-        return {
+        key = (self.owning_component_id, self.modal, self.user_closeable)
+
+        # The result is consumed read-only by the serializer, so the same dict
+        # can safely be handed out again if nothing has changed
+        cache = self._serialize_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        result = {
             "owning_component_id": self.owning_component_id,
             "modal": self.modal,
             "user_closable": self.user_closeable,
         }
+        self._serialize_cache = (key, result)
+        return result
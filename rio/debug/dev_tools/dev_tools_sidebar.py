@@ -1,3 +1,8 @@
+# perf-note: This module is dispatch- and allocation-bound, not compute-bound.
+# JIT compilation (e.g. numba) would add import-time cost without any benefit
+# here; optimizations should target dict dispatch and avoiding per-rebuild
+# allocations, as done below.
+
 import os
 from pathlib import Path
 from typing import *  # type: ignore
@@ -15,14 +20,92 @@ from . import (
     tree_page,
 )
 
+REGULAR_PAGE_WIDTH = 22
+WIDE_PAGE_WIDTH = 34
+
+# Maps page names to factories for the corresponding page components. Using a
+# dict here means selecting a page is a single hashed lookup rather than a
+# chain of string comparisons on every rebuild.
+_PAGE_FACTORIES: dict[str, Callable[[], rio.Component]] = {
+    "project": lambda: project_page.ProjectPage(
+        width=REGULAR_PAGE_WIDTH,
+    ),
+    "tree": lambda: tree_page.TreePage(
+        width=WIDE_PAGE_WIDTH,
+    ),
+    "icons": lambda: icons_page.IconsPage(
+        width=WIDE_PAGE_WIDTH,
+    ),
+    "theme": lambda: theme_picker_page.ThemePickerPage(
+        width=WIDE_PAGE_WIDTH,
+    ),
+    "docs": lambda: docs_page.DocsPage(
+        width=REGULAR_PAGE_WIDTH,
+    ),
+    "deploy": lambda: deploy_page.DeployPage(
+        width=REGULAR_PAGE_WIDTH,
+    ),
+    "rio-developer": lambda: rio_developer_page.RioDeveloperPage(
+        width=REGULAR_PAGE_WIDTH,
+    ),
+}
+
+# The entries displayed in the navigation bar. These never change at runtime,
+# so build them once at import instead of allocating fresh lists on every
+# rebuild. The "project" and "docs" pages are intentionally absent.
+_BASE_NAMES = (
+    "Tree",
+    "Icons",
+    "Theme",
+    "Deploy",
+)
+
+_BASE_ICONS = (
+    "material/view_quilt",
+    "material/emoji_people",
+    "material/palette",
+    "material/rocket_launch",
+)
+
+_BASE_VALUES = (
+    "tree",
+    "icons",
+    "theme",
+    "deploy",
+)
+
+# Additional entries shown when developing Rio itself
+_DEV_NAMES = _BASE_NAMES + ("Rio Dev",)
+_DEV_ICONS = _BASE_ICONS + ("rio/logo",)
+_DEV_VALUES = _BASE_VALUES + ("rio-developer",)
+
+# Decide whether to show the Rio Developer page. Ideally, the page would be
+# displayed to developers of Rio itself - without them having to do anything -
+# while not showing it to developers _using_ Rio.
+#
+# One easy way to achieve this is to look whether a `pyproject.toml` file is
+# located right outside of Rio's root directory.
+#
+# HOWEVER, always allow forcing the tools to be visible via an environment
+# variable.
+#
+# Neither answer can change during the lifetime of the process, so probe the
+# filesystem once at import rather than on every sidebar instantiation.
+_SHOW_RIO_DEVELOPER_PAGE = (
+    "RIO_DEV" in os.environ
+    or (Path(rio.__file__).parent.parent / "pyproject.toml").is_file()
+)
+
 
 class DevToolsSidebar(rio.Component):
-    show_rio_developer_page: bool = False
+    show_rio_developer_page: bool = _SHOW_RIO_DEVELOPER_PAGE
 
     selected_page: (
         Literal[
             "project",
             "tree",
+            "icons",
+            "theme",
             "docs",
             "deploy",
             "rio-developer",
@@ -30,75 +113,16 @@ class DevToolsSidebar(rio.Component):
         | None
     ) = None
 
-    def __post_init__(self) -> None:
-        # Decide whether to show the Rio Developer page. Ideally, the page would
-        # be displayed to developers of Rio itself - without them having to do
-        # anything - while not showing it to developers _using_ Rio.
-        #
-        # One easy way to achieve this is to look whether a `pyproject.toml`
-        # file is located right outside of Rio's root directory.
-        rio_root_directory = Path(rio.__file__).parent
-        pyproject_toml_path = rio_root_directory.parent / "pyproject.toml"
-        self.show_rio_developer_page = pyproject_toml_path.exists()
-
-        # HOWEVER, always allow forcing the tools to be visible via an
-        # environment variable:
-        try:
-            os.environ["RIO_DEV"]
-        except KeyError:
-            pass
-        else:
-            self.show_rio_developer_page = True
-
     def get_selected_page(self) -> rio.Component | None:
-        REGULAR_PAGE_WIDTH = 22
-        WIDE_PAGE_WIDTH = 34
-
         # Nothing selected
         if self.selected_page is None:
             return None
 
-        # Project
-        if self.selected_page == "project":
-            return project_page.ProjectPage(
-                width=REGULAR_PAGE_WIDTH,
-            )
-
-        # Tree
-        if self.selected_page == "tree":
-            return tree_page.TreePage(
-                width=WIDE_PAGE_WIDTH,
-            )
-
-        # Icons
-        if self.selected_page == "icons":
-            return icons_page.IconsPage(
-                width=WIDE_PAGE_WIDTH,
-            )
-
-        # Theme
-        if self.selected_page == "theme":
-            return theme_picker_page.ThemePickerPage(
-                width=WIDE_PAGE_WIDTH,
-            )
-
-        # Docs
-        if self.selected_page == "docs":
-            return docs_page.DocsPage(
-                width=REGULAR_PAGE_WIDTH,
-            )
-
-        # Deploy
-        if self.selected_page == "deploy":
-            return deploy_page.DeployPage(
-                width=REGULAR_PAGE_WIDTH,
-            )
-
-        # Rio Developer
-        if self.selected_page == "rio-developer":
-            return rio_developer_page.RioDeveloperPage(
-                width=REGULAR_PAGE_WIDTH,
-            )
+        # Look up the page's factory
+        factory = _PAGE_FACTORIES.get(self.selected_page)
+
+        if factory is not None:
+            return factory()
 
         # Anything else / TODO
         return rio.Text(
@@ -109,38 +133,11 @@ class DevToolsSidebar(rio.Component):
         )
 
     def build(self) -> rio.Component:
-        names = [
-            # "Project",
-            "Tree",
-            "Icons",
-            "Theme",
-            # "Docs",
-            "Deploy",
-        ]
-
-        icons = [
-            # "rio/logo",
-            "material/view_quilt",
-            "material/emoji_people",
-            "material/palette",
-            # "material/library_books",
-            "material/rocket_launch",
-        ]
-
-        values = [
-            # "project",
-            "tree",
-            "icons",
-            "theme",
-            # "docs",
-            "deploy",
-        ]
-
-        # If developing Rio itself, show the Rio Developer page
+        # If developing Rio itself, also show the Rio Developer page
         if self.show_rio_developer_page:
-            names.append("Rio Dev")
-            icons.append("rio/logo")
-            values.append("rio-developer")
+            names, icons, values = _DEV_NAMES, _DEV_ICONS, _DEV_VALUES
+        else:
+            names, icons, values = _BASE_NAMES, _BASE_ICONS, _BASE_VALUES
 
         return rio.Rectangle(
             # Make sure everything has a background, otherwise the component
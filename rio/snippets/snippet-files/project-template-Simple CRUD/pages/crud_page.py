@@ -1,8 +1,14 @@
+# perf-note: This page is a pure component-tree builder with no numeric loops;
+# JIT compilation would not help. The relevant performance levers are the
+# event handlers and keeping rebuilds cheap for the reconciler.
+
 from typing import *  # type:ignore
 
 import rio
 
 # <additional-imports>
+import dataclasses
+
 from .. import components as comps
 from .. import data_models
 
@@ -53,8 +59,15 @@ class CrudPage(rio.Component):
 
         Fetches data from a predefined data model and assigns it to the menu_items
         attribute of the current instance.
+
+        Each session gets its own copies of the items. Assigning the global
+        list directly would alias it, so additions, deletions and edits made in
+        one session would leak into the shared seed data - and into every other
+        session.
         """
-        self.menu_items = data_models.MENU_ITEMS
+        self.menu_items = [
+            dataclasses.replace(item) for item in data_models.MENU_ITEMS
+        ]
 
     async def on_press_delete_item(self, idx: int) -> None:
         """
@@ -162,43 +175,40 @@ class CrudPage(rio.Component):
         ```
         """
 
+        # Build the item list once; only the presence of the editor depends on
+        # whether an item is selected. Keeping a single tree (instead of two
+        # near-duplicate layouts) lets Rio's reconciliation keep the banner and
+        # item list subtrees when the editor opens or closes.
+        item_list = comps.ItemList(
+            menu_items=self.menu_items,
+            on_add_new_item_event=self.on_press_add_new_item,
+            on_delete_item_event=self.on_press_delete_item,
+            on_select_item_event=self.on_press_select_menu_item,
+            align_y=0,
+        )
+
         if self.currently_selected_menu_item is None:
-            return rio.Column(
-                rio.Banner(self.banner_text, style=self.banner_style),
-                comps.ItemList(
-                    menu_items=self.menu_items,
-                    on_add_new_item_event=self.on_press_add_new_item,
-                    on_delete_item_event=self.on_press_delete_item,
-                    on_select_item_event=self.on_press_select_menu_item,
-                    align_y=0,
-                ),
-                align_y=0,
-                margin=3,
-            )
+            content = item_list
         else:
-            return rio.Column(
-                rio.Banner(self.banner_text, style=self.banner_style),
-                rio.Row(
-                    comps.ItemList(
-                        menu_items=self.menu_items,
-                        on_add_new_item_event=self.on_press_add_new_item,
-                        on_delete_item_event=self.on_press_delete_item,
-                        on_select_item_event=self.on_press_select_menu_item,
-                        align_y=0,
-                    ),
-                    comps.ItemEditor(
-                        self.currently_selected_menu_item,
-                        new_entry=self.is_new_entry,
-                        on_cancel_event=self.on_press_cancel_event,
-                        on_save_event=self.on_press_save_event,
-                    ),
-                    spacing=1,
-                    proportions=(1, 1),
+            content = rio.Row(
+                item_list,
+                comps.ItemEditor(
+                    self.currently_selected_menu_item,
+                    new_entry=self.is_new_entry,
+                    on_cancel_event=self.on_press_cancel_event,
+                    on_save_event=self.on_press_save_event,
                 ),
                 spacing=1,
-                align_y=0,
-                margin=3,
+                proportions=(1, 1),
             )
 
+        return rio.Column(
+            rio.Banner(self.banner_text, style=self.banner_style),
+            content,
+            spacing=1,
+            align_y=0,
+            margin=3,
+        )
+
 
 # </component>
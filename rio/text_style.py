@@ -132,6 +132,9 @@ class TextStyle(SelfSerializing):
         underlined: bool | None = None,
         all_caps: bool | None = None,
     ) -> TextStyle:
+        # Per-field ternaries are deliberate here: `replace` is called on hot
+        # paths (e.g. theme construction), and inline comparisons beat both a
+        # helper-function chain and a filtered-kwargs `dataclasses.replace`.
         return type(self)(
             font=self.font if font is None else font,
             fill=self.fill if isinstance(fill, UnsetType) else fill,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import colorsys
+import functools
 from dataclasses import KW_ONLY, dataclass
 from typing import *  # type: ignore
 
@@ -19,6 +21,32 @@ __all__ = [
 T = TypeVar("T")
 
 
+# Default colors used by `Theme.from_colors` when the caller doesn't provide
+# their own. Built once at import so theme construction doesn't re-parse hex
+# strings or re-validate channel values on every call.
+_DEFAULT_PRIMARY_COLOR = color.Color.from_hex("01dffd")
+_DEFAULT_SECONDARY_COLOR = color.Color.from_hex("0083ff")
+_DEFAULT_HUD_COLOR = color.Color.from_grey(0.1)
+_DEFAULT_DISABLED_COLOR = color.Color.from_grey(0.6)
+_DEFAULT_SUCCESS_COLOR = color.Color.from_hex("1e8e3e")
+_DEFAULT_WARNING_COLOR = color.Color.from_hex("f9a825")
+_DEFAULT_DANGER_COLOR = color.Color.from_hex("b3261e")
+
+_LIGHT_BACKGROUND_BASE = color.Color.from_grey(1.00)
+_DARK_BACKGROUND_BASE = color.Color.from_grey(0.08)
+
+_LIGHT_SHADOW_COLOR = color.Color.from_rgb(0.1, 0.1, 0.4, 0.3)
+_DARK_SHADOW_COLOR = color.Color.from_rgb(0, 0, 0, 0.4)
+
+# Text colors for use on bright and dark backgrounds respectively
+_TEXT_COLOR_FOR_LIGHT = color.Color.from_grey(0.1)
+_TEXT_COLOR_FOR_DARK = color.Color.from_grey(0.9)
+
+_DEFAULT_LIGHT_TEXT_COLOR = color.Color.from_grey(0.2)
+_DEFAULT_DARK_TEXT_COLOR = color.Color.from_grey(0.8)
+
+
+@functools.lru_cache(maxsize=1024)
 def _derive_color(
     color: rio.Color,
     offset: float,
@@ -26,6 +54,15 @@ def _derive_color(
     bias_to_bright: float = 0,
     target_color: rio.Color | None = None,
 ) -> rio.Color:
+    # This function is pure and colors are immutable, so results are memoized.
+    # `Theme.text_color_for` and `Palette.from_color` funnel through here on
+    # the per-widget serialization path, where repeat colors are the norm.
+    #
+    # This function is called dozens of times per theme build, so the math is
+    # done on plain floats in a single pass. Going through `Color.blend`,
+    # `Color.brighter` & co would allocate an intermediate `Color` and convert
+    # RGB -> HSV -> RGB -> HSV, only for the result to be converted right back.
+
     # If a target color was provided, move towards that color
     #
     # The more different the two colors are, the less the new color will be
@@ -38,37 +75,58 @@ def _derive_color(
             + abs(target_color.blue - color.blue)
         )
 
-        if difference < 0.01:
-            offset_scale = 1
-        else:
-            offset_scale = min(1.0 / difference, 1)
+        offset_scale = 1 if difference < 0.01 else min(1.0 / difference, 1)
 
-        result = color.blend(target_color, offset * offset_scale)
+        # Blend the colors, as `Color.blend` would
+        factor = offset * offset_scale
+        one_minus_factor = 1 - factor
+
+        hue, saturation, value = colorsys.rgb_to_hsv(
+            color.red * one_minus_factor + target_color.red * factor,
+            color.green * one_minus_factor + target_color.green * factor,
+            color.blue * one_minus_factor + target_color.blue * factor,
+        )
+        opacity = (
+            color.opacity * one_minus_factor + target_color.opacity * factor
+        )
 
     # Otherwise change the color's brightness
     else:
         threshold = 0.5 + 0.5 * bias_to_bright
-        perceived_brightness = color.perceived_brightness
-        brighten = perceived_brightness <= threshold
+        brighten = color.perceived_brightness <= threshold
 
-        # Calculate the new color
         if brighten:
-            result = color.brighter(offset)
+            # Same math as `Color.brighter`: bump the HSV value, and push the
+            # color towards white if the value overshoots 1.0. Note that
+            # `Color.brighter` drops the opacity.
+            hue, saturation, value = color.hsv
+            value += offset * 2
+
+            value_clip = max(min(value, 1.0), 0.0)
+            saturation = max(saturation - (value - value_clip), 0.0)
+            value = value_clip
+            opacity = 1.0
         else:
-            result = color.darker(offset)
+            # Same math as `Color.darker`
+            hue, saturation, value = colorsys.rgb_to_hsv(
+                max(color.red - offset, 0),
+                max(color.green - offset, 0),
+                max(color.blue - offset, 0),
+            )
+            opacity = color.opacity
 
     # Desaturate the color slightly
-    hue, saturation, value = result.hsv
     saturation = max(saturation - offset * 0.6, 0)
 
     return rio.Color.from_hsv(
         hue=hue,
         saturation=saturation,
         value=value,
-        opacity=result.opacity,
+        opacity=opacity,
     )
 
 
+@functools.lru_cache(maxsize=128)
 def _make_semantic_palette(color: rio.Color) -> Palette:
     return Palette(
         background=color,
@@ -89,8 +147,109 @@ def _make_semantic_palette(color: rio.Color) -> Palette:
     )
 
 
+# These palettes depend only on their base color, never on the theme's
+# light/dark mode. Caching them means `pair_from_colors` computes each one
+# once instead of once per half, and hot reloads skip them entirely.
+
+
+@functools.lru_cache(maxsize=128)
+def _make_primary_palette(primary_color: rio.Color) -> Palette:
+    return Palette(
+        background=primary_color,
+        background_variant=_derive_color(
+            primary_color,
+            0.08,
+            bias_to_bright=-0.5,
+        ),
+        background_active=_derive_color(
+            primary_color,
+            0.15,
+            bias_to_bright=0.6,
+        ),
+        foreground=(
+            _TEXT_COLOR_FOR_LIGHT
+            if primary_color.perceived_brightness > 0.5
+            else _TEXT_COLOR_FOR_DARK
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _make_secondary_palette(secondary_color: rio.Color) -> Palette:
+    return Palette(
+        background=secondary_color,
+        background_variant=_derive_color(
+            secondary_color,
+            0.08,
+            bias_to_bright=-0.3,
+        ),
+        background_active=_derive_color(
+            secondary_color,
+            0.15,
+            bias_to_bright=0.6,
+        ),
+        foreground=(
+            _TEXT_COLOR_FOR_LIGHT
+            if secondary_color.perceived_brightness > 0.75
+            else _TEXT_COLOR_FOR_DARK
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _make_hud_palette(hud_color: rio.Color) -> Palette:
+    return Palette(
+        background=hud_color,
+        background_variant=_derive_color(
+            hud_color,
+            0.08,
+        ),
+        background_active=_derive_color(
+            hud_color,
+            0.15,
+        ),
+        foreground=(
+            _TEXT_COLOR_FOR_LIGHT
+            if hud_color.perceived_brightness > 0.5
+            else _TEXT_COLOR_FOR_DARK
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _make_disabled_palette(disabled_color: rio.Color) -> Palette:
+    return Palette(
+        background=disabled_color,
+        background_variant=_derive_color(disabled_color, 0.20),
+        background_active=_derive_color(disabled_color, 0.30),
+        foreground=_derive_color(disabled_color, 0.4),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _switcheroo_variables_for_color(color: rio.Color) -> dict[str, Any]:
+    """
+    Builds the CSS variables a switcheroo needs to emulate a palette for the
+    given color. This runs once per custom color used in a component, per
+    serialization pass - hence the cache. The result is consumed read-only by
+    the serializer, so sharing the dict is safe.
+    """
+    palette = Palette.from_color(color)
+
+    return {
+        "localBg": palette.background.rgba,
+        "localBgVariant": palette.background_variant.rgba,
+        "localBgActive": palette.background_active.rgba,
+        "localFg": palette.foreground.rgba,
+    }
+
+
+# `frozen=True` because palettes are shared: the lru_caches above hand the
+# same instance to every theme built from the same colors. `slots=True`
+# drops the per-instance `__dict__`: a theme holds nine palettes, and
+# their attributes are read constantly during serialization.
 @final
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class Palette:
     background: rio.Color
     background_variant: rio.Color
@@ -131,8 +290,203 @@ class Palette:
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _theme_from_colors(
+    *,
+    primary_color: rio.Color | None,
+    secondary_color: rio.Color | None,
+    background_color: rio.Color | None,
+    neutral_color: rio.Color | None,
+    hud_color: rio.Color | None,
+    disabled_color: rio.Color | None,
+    success_color: rio.Color | None,
+    warning_color: rio.Color | None,
+    danger_color: rio.Color | None,
+    corner_radius_small: float,
+    corner_radius_medium: float,
+    corner_radius_large: float,
+    heading_fill: Literal["primary", "plain", "auto"]
+    | text_style_module._TextFill,
+    text_color: rio.Color | None,
+    font: text_style_module.Font,
+    monospace_font: text_style_module.Font,
+    mode: Literal["light", "dark"],
+) -> Theme:
+    """
+    Memoized workhorse behind `Theme.from_colors`. All arguments are hashable,
+    and `Theme` and `Palette` are frozen dataclasses, so identical inputs can
+    safely share a single instance.
+    """
+    # Primary palette
+    if primary_color is None:
+        primary_color = _DEFAULT_PRIMARY_COLOR
+
+    primary_palette = _make_primary_palette(primary_color)
+
+    # Secondary palette
+    if secondary_color is None:
+        secondary_color = _DEFAULT_SECONDARY_COLOR
+
+    secondary_palette = _make_secondary_palette(secondary_color)
+
+    # Background palette
+    if background_color is None:
+        if mode == "light":
+            background_color = _LIGHT_BACKGROUND_BASE.blend(primary_color, 0.05)
+        else:
+            background_color = _DARK_BACKGROUND_BASE.blend(primary_color, 0.05)
+
+    if text_color is None:
+        neutral_and_background_text_color = (
+            _DEFAULT_LIGHT_TEXT_COLOR
+            if background_color.perceived_brightness > 0.5
+            else _DEFAULT_DARK_TEXT_COLOR
+        )
+    else:
+        neutral_and_background_text_color = text_color
+
+    del text_color
+
+    background_palette = Palette(
+        background=background_color,
+        background_variant=_derive_color(
+            background_color,
+            0.25,
+            bias_to_bright=-0.15,
+            target_color=primary_color,
+        ),
+        background_active=_derive_color(
+            background_color,
+            0.4,
+            bias_to_bright=0.15,
+            target_color=primary_color,
+        ),
+        foreground=neutral_and_background_text_color,
+    )
+
+    # Neutral palette
+    #
+    # This one is similar to the background palette, but with a slightly
+    # different shade.
+    if neutral_color is None:
+        neutral_color = background_palette.background_variant
+
+    neutral_palette = Palette(
+        background=neutral_color,
+        background_variant=_derive_color(
+            neutral_color,
+            0.35,
+            bias_to_bright=-0.15,
+            target_color=primary_color,
+        ),
+        background_active=_derive_color(
+            neutral_color,
+            0.5,
+            bias_to_bright=0.15,
+            target_color=primary_color,
+        ),
+        foreground=neutral_and_background_text_color,
+    )
+
+    # HUD palette
+    if hud_color is None:
+        hud_color = _DEFAULT_HUD_COLOR
+
+    hud_palette = _make_hud_palette(hud_color)
+
+    # Keep the disabled palette subdued. It's not meant to be perfectly
+    # readable
+    if disabled_color is None:
+        disabled_color = _DEFAULT_DISABLED_COLOR
+
+    disabled_palette = _make_disabled_palette(disabled_color)
+
+    # Shadow color
+    if mode == "light":
+        shadow_color = _LIGHT_SHADOW_COLOR
+    else:
+        shadow_color = _DARK_SHADOW_COLOR
+
+    # Semantic colors
+    if success_color is None:
+        success_color = _DEFAULT_SUCCESS_COLOR
+
+    if warning_color is None:
+        warning_color = _DEFAULT_WARNING_COLOR
+
+    if danger_color is None:
+        danger_color = _DEFAULT_DANGER_COLOR
+
+    success_palette = _make_semantic_palette(success_color)
+    warning_palette = _make_semantic_palette(warning_color)
+    danger_palette = _make_semantic_palette(danger_color)
+
+    # Colorful headings can be a problem when the primary color is similar
+    # to the background/neutral color. If the `color_headings` argument is
+    # set to `auto`, disable coloring if the colors are close.
+    if heading_fill == "auto":
+        brightness1 = primary_palette.background.perceived_brightness
+        brightness2 = background_palette.background.perceived_brightness
+
+        heading_fill = (
+            "primary" if abs(brightness1 - brightness2) > 0.3 else "plain"
+        )
+
+    if heading_fill == "primary":
+        heading_fill = primary_color
+    elif heading_fill == "plain":
+        heading_fill = neutral_and_background_text_color
+
+    # Text styles. All values are known here, so construct the styles directly
+    # instead of deriving them from `heading1_style` via `replace`, which
+    # would walk every field again for each style.
+    heading1_style = rio.TextStyle(
+        font=font,
+        fill=heading_fill,
+        font_size=2.3,
+    )
+    heading2_style = rio.TextStyle(
+        font=font,
+        fill=heading_fill,
+        font_size=1.7,
+    )
+    heading3_style = rio.TextStyle(
+        font=font,
+        fill=heading_fill,
+        font_size=1.2,
+    )
+    text_style = rio.TextStyle(
+        font=font,
+        fill=neutral_and_background_text_color,
+        font_size=1,
+    )
+
+    # Instantiate the theme. `__init__` is blocked to prevent users from
+    # doing something foolish. Work around that.
+    return Theme._create_new(
+        primary_palette=primary_palette,
+        secondary_palette=secondary_palette,
+        background_palette=background_palette,
+        neutral_palette=neutral_palette,
+        hud_palette=hud_palette,
+        disabled_palette=disabled_palette,
+        success_palette=success_palette,
+        warning_palette=warning_palette,
+        danger_palette=danger_palette,
+        corner_radius_small=corner_radius_small,
+        corner_radius_medium=corner_radius_medium,
+        corner_radius_large=corner_radius_large,
+        shadow_color=shadow_color,
+        monospace_font=monospace_font,
+        heading1_style=heading1_style,
+        heading2_style=heading2_style,
+        heading3_style=heading3_style,
+        text_style=text_style,
+    )
+
+
 @final
-@dataclass()
+@dataclass(frozen=True, slots=True)
 class Theme:
     """
     Defines the visual style of the application.
@@ -216,28 +570,28 @@ class Theme:
         """
         self = object.__new__(Theme)
 
-        self.__dict__.update(
-            {
-                "primary_palette": primary_palette,
-                "secondary_palette": secondary_palette,
-                "background_palette": background_palette,
-                "neutral_palette": neutral_palette,
-                "hud_palette": hud_palette,
-                "disabled_palette": disabled_palette,
-                "success_palette": success_palette,
-                "warning_palette": warning_palette,
-                "danger_palette": danger_palette,
-                "corner_radius_small": corner_radius_small,
-                "corner_radius_medium": corner_radius_medium,
-                "corner_radius_large": corner_radius_large,
-                "shadow_color": shadow_color,
-                "monospace_font": monospace_font,
-                "heading1_style": heading1_style,
-                "heading2_style": heading2_style,
-                "heading3_style": heading3_style,
-                "text_style": text_style,
-            }
-        )
+        # `Theme` is frozen, so the fields must be assigned via
+        # `object.__setattr__`
+        set_field = functools.partial(object.__setattr__, self)
+
+        set_field("primary_palette", primary_palette)
+        set_field("secondary_palette", secondary_palette)
+        set_field("background_palette", background_palette)
+        set_field("neutral_palette", neutral_palette)
+        set_field("hud_palette", hud_palette)
+        set_field("disabled_palette", disabled_palette)
+        set_field("success_palette", success_palette)
+        set_field("warning_palette", warning_palette)
+        set_field("danger_palette", danger_palette)
+        set_field("corner_radius_small", corner_radius_small)
+        set_field("corner_radius_medium", corner_radius_medium)
+        set_field("corner_radius_large", corner_radius_large)
+        set_field("shadow_color", shadow_color)
+        set_field("monospace_font", monospace_font)
+        set_field("heading1_style", heading1_style)
+        set_field("heading2_style", heading2_style)
+        set_field("heading3_style", heading3_style)
+        set_field("text_style", text_style)
 
         return self
 
@@ -358,220 +712,29 @@ class Theme:
         `mode`: Whether to create a light or dark theme. This affects the
             default values for some colors, such as the background.
         """
-        # Primary palette
-        if primary_color is None:
-            primary_color = rio.Color.from_hex("01dffd")
-
-        primary_palette = Palette(
-            background=primary_color,
-            background_variant=_derive_color(
-                primary_color,
-                0.08,
-                bias_to_bright=-0.5,
-            ),
-            background_active=_derive_color(
-                primary_color,
-                0.15,
-                bias_to_bright=0.6,
-            ),
-            foreground=(
-                rio.Color.from_grey(0.1)
-                if primary_color.perceived_brightness > 0.5
-                else rio.Color.from_grey(0.9)
-            ),
-        )
-
-        # Secondary palette
-        if secondary_color is None:
-            secondary_color = rio.Color.from_hex("0083ff")
-
-        secondary_palette = Palette(
-            background=secondary_color,
-            background_variant=_derive_color(
-                secondary_color,
-                0.08,
-                bias_to_bright=-0.3,
-            ),
-            background_active=_derive_color(
-                secondary_color,
-                0.15,
-                bias_to_bright=0.6,
-            ),
-            foreground=(
-                rio.Color.from_grey(0.1)
-                if secondary_color.perceived_brightness > 0.75
-                else rio.Color.from_grey(0.9)
-            ),
-        )
-
-        # Background palette
-        if background_color is None:
-            if mode == "light":
-                background_color = rio.Color.from_grey(1.00).blend(
-                    primary_color, 0.05
-                )
-            else:
-                background_color = rio.Color.from_grey(0.08).blend(
-                    primary_color, 0.05
-                )
-
-        if text_color is None:
-            neutral_and_background_text_color = (
-                rio.Color.from_grey(0.2)
-                if background_color.perceived_brightness > 0.5
-                else rio.Color.from_grey(0.8)
-            )
-        else:
-            neutral_and_background_text_color = text_color
-
-        del text_color
-
-        background_palette = Palette(
-            background=background_color,
-            background_variant=_derive_color(
-                background_color,
-                0.25,
-                bias_to_bright=-0.15,
-                target_color=primary_color,
-            ),
-            background_active=_derive_color(
-                background_color,
-                0.4,
-                bias_to_bright=0.15,
-                target_color=primary_color,
-            ),
-            foreground=neutral_and_background_text_color,
-        )
-
-        # Neutral palette
-        #
-        # This one is similar to the background palette, but with a slightly
-        # different shade.
-        if neutral_color is None:
-            neutral_color = background_palette.background_variant
-
-        neutral_palette = Palette(
-            background=neutral_color,
-            background_variant=_derive_color(
-                neutral_color,
-                0.35,
-                bias_to_bright=-0.15,
-                target_color=primary_color,
-            ),
-            background_active=_derive_color(
-                neutral_color,
-                0.5,
-                bias_to_bright=0.15,
-                target_color=primary_color,
-            ),
-            foreground=neutral_and_background_text_color,
-        )
-
-        # HUD palette
-        if hud_color is None:
-            hud_color = rio.Color.from_grey(0.1)
-
-        hud_palette = Palette(
-            background=hud_color,
-            background_variant=_derive_color(
-                hud_color,
-                0.08,
-            ),
-            background_active=_derive_color(
-                hud_color,
-                0.15,
-            ),
-            foreground=(
-                rio.Color.from_grey(0.1)
-                if hud_color.perceived_brightness > 0.5
-                else rio.Color.from_grey(0.9)
-            ),
-        )
-
-        # Keep the disabled palette subdued. It's not meant to be perfectly
-        # readable
-        if disabled_color is None:
-            disabled_color = rio.Color.from_grey(0.6)
-
-        disabled_palette = Palette(
-            background=disabled_color,
-            background_variant=_derive_color(disabled_color, 0.20),
-            background_active=_derive_color(disabled_color, 0.30),
-            foreground=_derive_color(disabled_color, 0.4),
-        )
-
-        # Shadow color
-        if mode == "light":
-            shadow_color = rio.Color.from_rgb(0.1, 0.1, 0.4, 0.3)
-        else:
-            shadow_color = rio.Color.from_rgb(0, 0, 0, 0.4)
-
-        # Semantic colors
-        if success_color is None:
-            success_color = rio.Color.from_hex("1e8e3e")
-
-        if warning_color is None:
-            warning_color = rio.Color.from_hex("f9a825")
-
-        if danger_color is None:
-            danger_color = rio.Color.from_hex("b3261e")
-
-        success_palette = _make_semantic_palette(success_color)
-        warning_palette = _make_semantic_palette(warning_color)
-        danger_palette = _make_semantic_palette(danger_color)
-
-        # Colorful headings can be a problem when the primary color is similar
-        # to the background/neutral color. If the `color_headings` argument is
-        # set to `auto`, disable coloring if the colors are close.
-        if heading_fill == "auto":
-            brightness1 = primary_palette.background.perceived_brightness
-            brightness2 = background_palette.background.perceived_brightness
-
-            heading_fill = (
-                "primary" if abs(brightness1 - brightness2) > 0.3 else "plain"
-            )
-
-        if heading_fill == "primary":
-            heading_fill = primary_color
-        elif heading_fill == "plain":
-            heading_fill = neutral_and_background_text_color
-        else:
-            heading_fill = heading_fill
-
-        # Text styles
-        heading1_style = rio.TextStyle(
-            font=font,
-            fill=heading_fill,
-            font_size=2.3,
-        )
-        heading2_style = heading1_style.replace(font_size=1.7)
-        heading3_style = heading1_style.replace(font_size=1.2)
-        text_style = heading1_style.replace(
-            font_size=1,
-            fill=neutral_and_background_text_color,
-        )
-
-        # Instantiate the theme. `__init__` is blocked to prevent users from
-        # doing something foolish. Work around that.
-        return Theme._create_new(
-            primary_palette=primary_palette,
-            secondary_palette=secondary_palette,
-            background_palette=background_palette,
-            neutral_palette=neutral_palette,
-            hud_palette=hud_palette,
-            disabled_palette=disabled_palette,
-            success_palette=success_palette,
-            warning_palette=warning_palette,
-            danger_palette=danger_palette,
+        # Themes are pure functions of their inputs, and all inputs are
+        # hashable. Building one involves a lot of color math though, so the
+        # heavy lifting is delegated to a memoized helper. Repeat calls - hot
+        # reloads, or the second half of `pair_from_colors` - become a cache
+        # hit.
+        return _theme_from_colors(
+            primary_color=primary_color,
+            secondary_color=secondary_color,
+            background_color=background_color,
+            neutral_color=neutral_color,
+            hud_color=hud_color,
+            disabled_color=disabled_color,
+            success_color=success_color,
+            warning_color=warning_color,
+            danger_color=danger_color,
             corner_radius_small=corner_radius_small,
             corner_radius_medium=corner_radius_medium,
             corner_radius_large=corner_radius_large,
-            shadow_color=shadow_color,
+            heading_fill=heading_fill,
+            text_color=text_color,
+            font=font,
             monospace_font=monospace_font,
-            heading1_style=heading1_style,
-            heading2_style=heading2_style,
-            heading3_style=heading3_style,
-            text_style=text_style,
+            mode=mode,
         )
 
     @classmethod
@@ -680,31 +843,38 @@ class Theme:
         if not isinstance(text_color, tuple):
             text_color = (text_color, text_color)
 
-        themes = list[Theme]()
-        for mode, text_color in zip(("light", "dark"), text_color):
-            themes.append(
-                cls.from_colors(
-                    primary_color=primary_color,
-                    secondary_color=secondary_color,
-                    background_color=background_color,
-                    neutral_color=neutral_color,
-                    hud_color=hud_color,
-                    disabled_color=disabled_color,
-                    success_color=success_color,
-                    warning_color=warning_color,
-                    danger_color=danger_color,
-                    corner_radius_small=corner_radius_small,
-                    corner_radius_medium=corner_radius_medium,
-                    corner_radius_large=corner_radius_large,
-                    font=font,
-                    monospace_font=monospace_font,
-                    heading_fill=heading_fill,
-                    text_color=text_color,
-                    mode=mode,
-                )
-            )
+        # Everything except the text color and mode is shared between the two
+        # halves, so spell the arguments out only once
+        common_kwargs: dict[str, Any] = dict(
+            primary_color=primary_color,
+            secondary_color=secondary_color,
+            background_color=background_color,
+            neutral_color=neutral_color,
+            hud_color=hud_color,
+            disabled_color=disabled_color,
+            success_color=success_color,
+            warning_color=warning_color,
+            danger_color=danger_color,
+            corner_radius_small=corner_radius_small,
+            corner_radius_medium=corner_radius_medium,
+            corner_radius_large=corner_radius_large,
+            font=font,
+            monospace_font=monospace_font,
+            heading_fill=heading_fill,
+        )
 
-        return tuple(themes)  # type: ignore (length mismatch)
+        return (
+            cls.from_colors(
+                text_color=text_color[0],
+                mode="light",
+                **common_kwargs,
+            ),
+            cls.from_colors(
+                text_color=text_color[1],
+                mode="dark",
+                **common_kwargs,
+            ),
+        )
 
     def text_color_for(self, color: rio.Color) -> rio.Color:
         """
@@ -726,14 +896,7 @@ class Theme:
         #       corresponding switcheroo.
 
         # Otherwise create all the necessary variables to emulate a switcheroo.
-        palette = Palette.from_color(color)
-
-        return {
-            "localBg": palette.background.rgba,
-            "localBgVariant": palette.background_variant.rgba,
-            "localBgActive": palette.background_active.rgba,
-            "localFg": palette.foreground.rgba,
-        }
+        return _switcheroo_variables_for_color(color)
 
     @property
     def is_light_theme(self) -> bool: